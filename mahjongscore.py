@@ -10,7 +10,10 @@ Licensed under MIT No Attribution (MIT-0), see LICENSE.
 """
 
 import argparse
+import collections
 import csv
+import functools
+import io
 import math
 import os
 import re
@@ -22,17 +25,64 @@ DEFAULT_MAXIMUM_FAAN = 13
 DEFAULT_RESPONSIBILITY = 'full'
 DEFAULT_SPICINESS = 'half'
 
+PLAYER_NAME_REGEX = r'[^\s#*0-9-][^\s#*]*'
+FAAN_REGEX = '[0-9]+'
+BLAME_REGEX = '[-dDSf]'  # null, discard, discard-guarantee, self-draw-guarantee, or false-win
+LINE_PATTERN = re.compile(
+    fr'''
+        ^ [\s]*
+        (?:
+            (?P<date_line>
+                (?P<date> [0-9]{{4}} - [0-9]{{2}} - [0-9]{{2}} )
+            )
+                |
+            (?P<base_line>
+                B=(?P<base> [.0-9]+ )
+            )
+                |
+            (?P<maximum_line>
+                M=(?P<maximum_faan> [0-9]+ )
+            )
+                |
+            (?P<responsibility_line>
+                R=(?P<responsibility> half | full )
+            )
+                |
+            (?P<spiciness_line>
+                S=(?P<spiciness> half | spicy )
+            )
+                |
+            (?P<players_line>
+                (?P<name_0> {PLAYER_NAME_REGEX} )
+                    [\s]+
+                (?P<name_1> {PLAYER_NAME_REGEX} )
+                    [\s]+
+                (?P<name_2> {PLAYER_NAME_REGEX} )
+                    [\s]+
+                (?P<name_3> {PLAYER_NAME_REGEX} )
+            )
+                |
+            (?P<game_line>
+                (?P<result_0> {FAAN_REGEX} | {BLAME_REGEX} )
+                    [\s]+
+                (?P<result_1> {FAAN_REGEX} | {BLAME_REGEX} )
+                    [\s]+
+                (?P<result_2> {FAAN_REGEX} | {BLAME_REGEX} )
+                    [\s]+
+                (?P<result_3> {FAAN_REGEX} | {BLAME_REGEX} )
+            )
+                |
+            (?P<comment_line>)
+        )
+        [\s]* (?: [#] .* )? $
+    ''',
+    flags=re.VERBOSE,
+)
 
-def get_duplicates(iterable):
-    seen_items = set()
-    duplicate_items = []
-    for item in iterable:
-        if item in seen_items:
-            duplicate_items.append(item)
-        else:
-            seen_items.add(item)
 
-    return duplicate_items
+def get_duplicates(iterable):
+    item_counts = collections.Counter(iterable)
+    return [item for item, count in item_counts.items() if count > 1]
 
 
 def robust_divide(dividend, divisor):
@@ -56,7 +106,8 @@ def blunt(number, max_decimal_places=4, none_to_nan=False):
         return '0'
 
     nice_string = f'{number :.{max_decimal_places}F}'
-    nice_string = re.sub(r'[.]?0*$', '', nice_string)
+    if '.' in nice_string:
+        nice_string = nice_string.rstrip('0').rstrip('.')
 
     return nice_string
 
@@ -93,6 +144,8 @@ class ScoreMaster:
         f'All other lines are invalid.\n'
     )
 
+    INVALID_LINE_MESSAGE = f'invalid line\n\n{LINE_EXPLAINER}'
+
     @staticmethod
     def parse(scores_text, start_date=None, end_date=None):
         player_from_name = {}
@@ -104,13 +157,24 @@ class ScoreMaster:
         responsibility = DEFAULT_RESPONSIBILITY
         spiciness = DEFAULT_SPICINESS
         names = None
+        seated_players = None
+
+        if isinstance(scores_text, str):
+            lines = scores_text.splitlines()
+        else:  # iterable of lines, e.g. an open file, read lazily
+            lines = (line for raw_line in scores_text for line in raw_line.splitlines())
 
-        lines = scores_text.splitlines()
         for line_number, line in enumerate(lines, start=1):
 
-            date_line_match = ScoreMaster.match_date_line(line)
-            if date_line_match:
-                new_date = date_line_match.group('date')
+            stripped_line = line.strip()
+            if not stripped_line or stripped_line.startswith('#'):  # cheap check for blank or comment lines
+                continue
+
+            line_match = ScoreMaster.match_line(line)
+            line_kind = line_match.lastgroup if line_match else None
+
+            if line_kind == 'date_line':
+                new_date = line_match.group('date')
                 if date is not None and new_date < date:
                     raise ScoreMaster.BadChronologyException(
                         line_number,
@@ -127,9 +191,8 @@ class ScoreMaster:
                 if date is None or date >= end_date:
                     continue
 
-            base_line_match = ScoreMaster.match_base_line(line)
-            if base_line_match:
-                base_str = base_line_match.group('base')
+            if line_kind == 'base_line':
+                base_str = line_match.group('base')
                 try:
                     base = float(base_str)
                 except ValueError:
@@ -139,58 +202,51 @@ class ScoreMaster:
                     )
                 continue
 
-            maximum_line_match = ScoreMaster.match_maximum_line(line)
-            if maximum_line_match:
-                maximum_faan = int(maximum_line_match.group('maximum_faan'))
+            if line_kind == 'maximum_line':
+                maximum_faan = int(line_match.group('maximum_faan'))
                 continue
 
-            responsibility_line_match = ScoreMaster.match_responsibility_line(line)
-            if responsibility_line_match:
-                responsibility = responsibility_line_match.group('responsibility')
+            if line_kind == 'responsibility_line':
+                responsibility = line_match.group('responsibility')
                 continue
 
-            spiciness_line_match = ScoreMaster.match_spiciness_line(line)
-            if spiciness_line_match:
-                spiciness = spiciness_line_match.group('spiciness')
+            if line_kind == 'spiciness_line':
+                spiciness = line_match.group('spiciness')
                 continue
 
-            players_line_match = ScoreMaster.match_players_line(line)
-            if players_line_match:
+            if line_kind == 'players_line':
                 names = tuple(
-                    players_line_match.group(f'name_{i}')
-                    for i in range(0, 4)
+                    sys.intern(name)
+                    for name in line_match.group('name_0', 'name_1', 'name_2', 'name_3')
                 )
 
-                duplicate_names = get_duplicates(names)
-                if duplicate_names:
+                if len(set(names)) < len(names):
+                    duplicate_names = get_duplicates(names)
                     raise ScoreMaster.DuplicatePlayerNamesException(
                         line_number,
                         f'duplicate player names {duplicate_names}',
                     )
 
+                seated_player_list = []
                 for name in names:
-                    if name not in player_from_name:
-                        player_from_name[name] = Player(name)
+                    player = player_from_name.get(name)
+                    if player is None:
+                        player = player_from_name[name] = Player(name)
+                    seated_player_list.append(player)
+                seated_players = tuple(seated_player_list)
                 continue
 
-            game_line_match = ScoreMaster.match_game_line(line)
-            if game_line_match:
+            if line_kind == 'game_line':
                 if names is None:
                     raise ScoreMaster.NoPlayersException(
                         line_number,
                         f'game declared without first declaring player names',
                     )
 
-                faans = tuple(
-                    ScoreMaster.normalise_faan(game_line_match.group(f'faan_{i}'))
-                    for i in range(0, 4)
-                )
-                winner_index, winner_faan = ScoreMaster.extract_faan(faans, maximum_faan, line_number)
+                results = line_match.group('result_0', 'result_1', 'result_2', 'result_3')
 
-                blames = tuple(
-                    ScoreMaster.normalise_blame(game_line_match.group(f'blame_{i}'))
-                    for i in range(0, 4)
-                )
+                faans, blames = ScoreMaster.normalise_results(results)
+                winner_index, winner_faan = ScoreMaster.extract_faan(faans, maximum_faan, line_number)
                 blame_index, blame_type = ScoreMaster.extract_blame(blames, line_number)
 
                 if winner_index is None:
@@ -215,30 +271,33 @@ class ScoreMaster:
                 games.append(
                     Game(
                         date, base, maximum_faan, responsibility, spiciness,
-                        names, winner_index, winner_faan, blame_index, blame_type,
+                        seated_players, winner_index, winner_faan, blame_index, blame_type,
                     )
                 )
                 continue
 
-            if ScoreMaster.match_comment_line(line):
+            # Blank and comment lines were already skipped by the check above;
+            # this branch is kept only so that `match_line` stays a complete classifier.
+            if line_kind == 'comment_line':
                 continue
 
             raise ScoreMaster.InvalidLineException(
                 line_number,
-                f'invalid line\n\n{ScoreMaster.LINE_EXPLAINER}',
+                ScoreMaster.INVALID_LINE_MESSAGE,
             )
 
         for game in games:
-            game.update(player_from_name)
+            game.update()
 
-        players = list(player_from_name.values())
         everyone = Player('*')
-        everyone.game_count = sum(p.game_count for p in players)
-        everyone.win_count = sum(p.win_count for p in players)
-        everyone.blame_count = sum(p.blame_count for p in players)
-        everyone.net_score = sum(p.net_score for p in players)
+        for player in player_from_name.values():
+            everyone.game_count += player.game_count
+            everyone.win_count += player.win_count
+            everyone.blame_count += player.blame_count
+            everyone.net_score += player.net_score
 
-        players_including_everyone = players + [everyone]
+        players_including_everyone = list(player_from_name.values())
+        players_including_everyone.append(everyone)
 
         for player in players_including_everyone:
             player.update_averages()
@@ -246,132 +305,35 @@ class ScoreMaster:
         return players_including_everyone, games
 
     @staticmethod
-    def match_date_line(line):
-        return re.fullmatch(
-            pattern=r'''
-                ^ [\s]*
-                (?P<date> [0-9]{4} - [0-9]{2} - [0-9]{2} )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
+    @functools.lru_cache(maxsize=1024)
+    def match_line(line):
+        """
+        Match a line against all line forms at once.
 
-    @staticmethod
-    def match_base_line(line):
-        return re.fullmatch(
-            pattern=fr'''
-                ^ [\s]*
-                B=(?P<base> [.0-9]+ )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
-
-    @staticmethod
-    def match_maximum_line(line):
-        return re.fullmatch(
-            pattern=fr'''
-                ^ [\s]*
-                M=(?P<maximum_faan> [0-9]+ )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
+        The kind of line is given by `lastgroup` of the returned match,
+        being one of `date_line`, `base_line`, `maximum_line`,
+        `responsibility_line`, `spiciness_line`, `players_line`, `game_line`,
+        or `comment_line`.
 
-    @staticmethod
-    def match_responsibility_line(line):
-        return re.fullmatch(
-            pattern=fr'''
-                ^ [\s]*
-                R=(?P<responsibility> half | full )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
+        Matches are cached, since the same game lines recur throughout a file.
+        """
+        return LINE_PATTERN.fullmatch(line)
 
     @staticmethod
-    def match_spiciness_line(line):
-        return re.fullmatch(
-            pattern=fr'''
-                ^ [\s]*
-                S=(?P<spiciness> half | spicy )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
+    def normalise_results(results):
+        faans = [None] * 4
+        blames = [None] * 4
+        for index, result in enumerate(results):
+            if result.isdigit():
+                faans[index] = int(result)
+            elif result != '-':
+                blames[index] = result
 
-    @staticmethod
-    def match_players_line(line):
-        player_name_regex = r'[^\s#*0-9-][^\s#*]*'
-        return re.fullmatch(
-            pattern=fr'''
-                ^ [\s]*
-                (?P<name_0> {player_name_regex} )
-                    [\s]+
-                (?P<name_1> {player_name_regex} )
-                    [\s]+
-                (?P<name_2> {player_name_regex} )
-                    [\s]+
-                (?P<name_3> {player_name_regex} )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
-
-    @staticmethod
-    def match_game_line(line):
-        faan_regex = '[0-9]+'
-        blame_regex = '[-dDSf]'  # null, discard, discard-guarantee, self-draw-guarantee, or false-win
-        return re.fullmatch(
-            pattern=fr'''
-                ^ [\s]*
-                (?: (?P<faan_0> {faan_regex} ) | (?P<blame_0> {blame_regex} )  )
-                    [\s]+
-                (?: (?P<faan_1> {faan_regex} ) | (?P<blame_1> {blame_regex} )  )
-                    [\s]+
-                (?: (?P<faan_2> {faan_regex} ) | (?P<blame_2> {blame_regex} )  )
-                    [\s]+
-                (?: (?P<faan_3> {faan_regex} ) | (?P<blame_3> {blame_regex} )  )
-                [\s]* (?: [#] .* )? $
-            ''',
-            string=line,
-            flags=re.VERBOSE,
-        )
-
-    @staticmethod
-    def match_comment_line(line):
-        return re.fullmatch(
-            pattern=r'^ [\s]* (?: [#] .* )? $',
-            string=line,
-            flags=re.VERBOSE,
-        )
-
-    @staticmethod
-    def normalise_faan(faan_string):
-        try:
-            return int(faan_string)
-        except TypeError:
-            return None
-
-    @staticmethod
-    def normalise_blame(blame_string):
-        if blame_string is None:
-            return None
-
-        if blame_string == '-':
-            return None
-
-        return blame_string
+        return tuple(faans), tuple(blames)
 
     @staticmethod
     def extract_faan(faans, maximum_faan, line_number):
-        faan_indices = set(i for i in range(0, 4) if faans[i] is not None)
+        faan_indices = [i for i, faan in enumerate(faans) if faan is not None]
 
         if len(faan_indices) > 1:
             raise ScoreMaster.MultipleWinnersException(
@@ -379,10 +341,10 @@ class ScoreMaster:
                 f'game declared with multiple winners (digits entries)',
             )
 
-        try:
-            winner_index = faan_indices.pop()
+        if faan_indices:
+            winner_index = faan_indices[0]
             winner_faan = faans[winner_index]
-        except KeyError:
+        else:
             winner_index = None
             winner_faan = None
 
@@ -396,7 +358,7 @@ class ScoreMaster:
 
     @staticmethod
     def extract_blame(blames, line_number):
-        blame_indices = set(i for i in range(0, 4) if blames[i] is not None)
+        blame_indices = [i for i, blame in enumerate(blames) if blame is not None]
 
         if len(blame_indices) > 1:
             raise ScoreMaster.MultipleBlameException(
@@ -404,19 +366,18 @@ class ScoreMaster:
                 f'game declared with multiple players blamed (suffix `d`, `S`, or `f`)',
             )
 
-        try:
-            blame_index = blame_indices.pop()
+        if blame_indices:
+            blame_index = blame_indices[0]
             blame_type = blames[blame_index]
-        except KeyError:
+        else:
             blame_index = None
             blame_type = None
 
         return blame_index, blame_type
 
     def write_tsv(self, file_name):
-        with open(file_name, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.writer(file, delimiter='\t', lineterminator=os.linesep)
-            writer.writerow([
+        rows = [
+            [
                 'name',
                 'game_count',
                 'win_count',
@@ -425,18 +386,25 @@ class ScoreMaster:
                 'blame_fraction',
                 'net_score',
                 'net_score_per_game',
+            ]
+        ]
+        for player in sorted(self.players_including_everyone, key=Player.rank):
+            rows.append([
+                player.name,
+                player.game_count,
+                player.win_count,
+                blunt(player.win_fraction, none_to_nan=True),
+                player.blame_count,
+                blunt(player.blame_fraction, none_to_nan=True),
+                blunt(player.net_score, none_to_nan=True),
+                blunt(player.net_score_per_game, none_to_nan=True),
             ])
-            for player in sorted(self.players_including_everyone):
-                writer.writerow([
-                    player.name,
-                    player.game_count,
-                    player.win_count,
-                    blunt(player.win_fraction, none_to_nan=True),
-                    player.blame_count,
-                    blunt(player.blame_fraction, none_to_nan=True),
-                    blunt(player.net_score, none_to_nan=True),
-                    blunt(player.net_score_per_game, none_to_nan=True),
-                ])
+
+        tsv_buffer = io.StringIO(newline='')
+        writer = csv.writer(tsv_buffer, delimiter='\t', lineterminator=os.linesep)
+        writer.writerows(rows)
+        with open(file_name, 'w', encoding='utf-8', newline='') as file:
+            file.write(tsv_buffer.getvalue())
 
     class BadLineException(Exception):
         def __init__(self, line_number, message):
@@ -478,6 +446,12 @@ class ScoreMaster:
 
 
 class Player:
+    __slots__ = (
+        'name',
+        'game_count', 'win_count', 'blame_count', 'net_score',
+        'win_fraction', 'blame_fraction', 'net_score_per_game',
+    )
+
     def __init__(self, name):
         self.name = name
 
@@ -495,12 +469,12 @@ class Player:
 
     def rank(self):
         is_everyone = self.name == '*'
-        net_score_per_game = (
-            -math.inf if self.net_score_per_game is None
-            else self.net_score_per_game
-        )
+        net_score_per_game = self.net_score_per_game
         name = self.name
 
+        if net_score_per_game is None:  # no games, so sort last
+            return is_everyone, math.inf, name
+
         return is_everyone, -net_score_per_game, name
 
     def update_averages(self):
@@ -510,8 +484,14 @@ class Player:
 
 
 class Game:
+    __slots__ = (
+        'date',
+        'base', 'maximum_faan', 'responsibility', 'spiciness',
+        'players', 'winner_index', 'winner_faan', 'blame_index', 'blame_type',
+    )
+
     def __init__(self, date, base, maximum_faan, responsibility, spiciness,
-                 names, winner_index, winner_faan, blame_index, blame_type):
+                 players, winner_index, winner_faan, blame_index, blame_type):
         self.date = date
 
         self.base = base
@@ -519,20 +499,38 @@ class Game:
         self.responsibility = responsibility
         self.spiciness = spiciness
 
-        self.names = names
+        self.players = players
         self.winner_index = winner_index
         self.winner_faan = winner_faan
         self.blame_index = blame_index
         self.blame_type = blame_type
 
-    def update(self, player_from_name):
+    NET_SCORE_COEFFICIENTS = {
+        # (has_winner, blame_type): (winner, blamed, blameless) portions
+
+        # Blamed player pays each other player the maximum self-drawn win (i.e. three portions).
+        (False, 'f'): (None, -9, +3),  # false-win (詐糊)
+
+        # Blameless players each pay winner one portion.
+        (True, None): (+3, None, -1),  # self-drawn win (自摸)
+
+        # Blamed player pays winner one portion; blameless players each pay winner a half portion.
+        (True, 'd'): (+2, -1, -1/2),  # discarding (打出) under half responsibility (半銃)
+
+        # Blamed player pays winner a double portion; same as full responsibility (全銃).
+        (True, 'D'): (+2, -2, 0),  # discard-guaranteeing (包打出)
+
+        # Blamed player pays winner three portions.
+        (True, 'S'): (+3, -3, 0),  # self-draw-guaranteeing (包自摸)
+    }
+
+    def update(self):
         net_scores = Game.compute_net_scores(
             self.base, self.maximum_faan, self.responsibility, self.spiciness,
             self.winner_index, self.winner_faan, self.blame_index, self.blame_type,
         )
 
-        for index, name in enumerate(self.names):
-            player = player_from_name[name]
+        for index, player in enumerate(self.players):
             player.game_count += 1
             player.win_count += 1 if index == self.winner_index else 0
             player.blame_count += 1 if index == self.blame_index else 0
@@ -543,84 +541,41 @@ class Game:
         base, maximum_faan, responsibility, spiciness,
         winner_index, winner_faan, blame_index, blame_type
     ):
-        if winner_index is None:  # no win
-
-            if blame_index is None:  # draw (摸和)
-                # Scores do not change.
-                return (0, 0, 0, 0)
-
-            elif blame_type == 'f':  # false-win (詐糊)
-                # Blamed player pays each other player the maximum self-drawn win (i.e. three portions).
-                portion = Game.compute_score_portion(base, spiciness, faan=maximum_faan)
-                return tuple(
-                    (-9 * portion) if i == blame_index else
-                    (+3 * portion)
-                    for i in range(0, 4)
+        if winner_index is None and blame_type is None:  # draw (摸和)
+            # Scores do not change.
+            return (0, 0, 0, 0)
+
+        if blame_type == 'd':  # discarding (打出)
+            if responsibility == 'full':  # full responsibility (全銃)
+                # Blamed player pays winner a double portion; same as discard-guaranteeing (包打出).
+                blame_type = 'D'
+            elif responsibility != 'half':
+                raise RuntimeError(
+                    'Implementation error: `responsibility` is neither `half` nor `full`'
                 )
 
+        try:
+            coefficients = Game.NET_SCORE_COEFFICIENTS[winner_index is not None, blame_type]
+        except KeyError:
             raise RuntimeError(
-                'Implementation error: `ScoreMaster.NoWinYetNonFalseBlameException` ought to have been raised'
+                'Implementation error: `ScoreMaster.NoWinYetNonFalseBlameException` '
+                'or `ScoreMaster.WinYetFalseBlameException` ought to have been raised'
             )
 
-        else:  # win
-
-            portion = Game.compute_score_portion(base, spiciness, faan=winner_faan)
-
-            if blame_index is None:  # self-drawn win (自摸)
-                # Blameless players each pay winner one portion.
-                return tuple(
-                    (+3 * portion) if i == winner_index else
-                    (-portion)
-                    for i in range(0, 4)
-                )
-
-            elif blame_type == 'd':  # discarding (打出)
-
-                if responsibility == 'half':  # half responsibility (半銃)
-                    # Blamed player pays winner one portion; blameless players each pay winner a half portion.
-                    return tuple(
-                        (+2 * portion) if i == winner_index else
-                        (-portion) if i == blame_index else
-                        (-portion/2)
-                        for i in range(0, 4)
-                    )
-
-                elif responsibility == 'full':  # full responsibility (全銃)
-                    # Blamed player pays winner a double portion.
-                    return tuple(
-                        (+2 * portion) if i == winner_index else
-                        (-2 * portion) if i == blame_index
-                        else 0
-                        for i in range(0, 4)
-                    )
-
-                raise RuntimeError(
-                    'Implementation error: `responsibility` is neither `half` nor `full`'
-                )
-
-            elif blame_type == 'D':  # discard-guaranteeing (包打出)
-                # Blamed player pays winner a double portion; same as full responsibility (全銃).
-                return tuple(
-                    (+2 * portion) if i == winner_index else
-                    (-2 * portion) if i == blame_index
-                    else 0
-                    for i in range(0, 4)
-                )
+        winner_coefficient, blamed_coefficient, blameless_coefficient = coefficients
+        faan = maximum_faan if winner_index is None else winner_faan
+        portion = Game.compute_score_portion(base, spiciness, faan=faan)
 
-            elif blame_type == 'S':  # self-draw-guaranteeing (包自摸)
-                # Blamed player pays winner three portions.
-                return tuple(
-                    (+3 * portion) if i == winner_index else
-                    (-3 * portion) if i == blame_index
-                    else 0
-                    for i in range(0, 4)
-                )
+        net_scores = [blameless_coefficient * portion] * 4
+        if winner_index is not None:
+            net_scores[winner_index] = winner_coefficient * portion
+        if blame_index is not None:
+            net_scores[blame_index] = blamed_coefficient * portion
 
-            raise RuntimeError(
-                'Implementation error: `ScoreMaster.WinYetFalseBlameException` ought to have been raised'
-            )
+        return tuple(net_scores)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def compute_score_portion(base, spiciness, faan):
         if spiciness == 'half':  # half-spicy rise (半辣上)
             if faan <= 4:
@@ -673,26 +628,24 @@ def parse_command_line_arguments():
     return argument_parser.parse_args()
 
 
-def read_scores_text(scores_file_name):
-    if os.path.isdir(scores_file_name):
+def open_scores_file(scores_file_name):
+    try:
+        return open(scores_file_name, 'r', encoding='utf-8')
+    except FileNotFoundError:
         print(
-            f'Error: `{scores_file_name}` is a directory, not a file',
+            f'Error: file `{scores_file_name}` not found',
             file=sys.stderr,
         )
         sys.exit(1)
-
-    try:
-        with open(scores_file_name, 'r', encoding='utf-8') as scores_file:
-            scores_text = scores_file.read()
-    except FileNotFoundError:
+    except (IsADirectoryError, PermissionError):  # Windows raises the latter for directories
+        if not os.path.isdir(scores_file_name):
+            raise
         print(
-            f'Error: file `{scores_file_name}` not found',
+            f'Error: `{scores_file_name}` is a directory, not a file',
             file=sys.stderr,
         )
         sys.exit(1)
 
-    return scores_text
-
 
 def main():
     parsed_arguments = parse_command_line_arguments()
@@ -700,16 +653,16 @@ def main():
     start_date = parsed_arguments.start_date
     end_date = parsed_arguments.end_date
 
-    scores_text = read_scores_text(scores_file_name)
-    try:
-        score_master = ScoreMaster(scores_text, start_date, end_date)
-    except ScoreMaster.BadLineException as exception:
-        line_number = exception.line_number
-        message = exception.message
-        print(
-            f'Error (`{scores_file_name}`, line {line_number}): {message}'
-        )
-        sys.exit(1)
+    with open_scores_file(scores_file_name) as scores_file:
+        try:
+            score_master = ScoreMaster(scores_file, start_date, end_date)
+        except ScoreMaster.BadLineException as exception:
+            line_number = exception.line_number
+            message = exception.message
+            print(
+                f'Error (`{scores_file_name}`, line {line_number}): {message}'
+            )
+            sys.exit(1)
 
     base_name = ''.join([
         scores_file_name,
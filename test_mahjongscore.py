@@ -9,6 +9,10 @@ Copyright 2023 Conway
 Licensed under MIT No Attribution (MIT-0), see LICENSE.
 """
 
+import csv
+import io
+import os
+import tempfile
 import unittest
 
 from mahjongscore import get_duplicates, robust_divide, blunt
@@ -21,167 +25,191 @@ class TestMahjongScore(unittest.TestCase):
         self.assertEqual(get_duplicates([1, 2, 3]), [])
         self.assertEqual(get_duplicates([1, 1, 2, 3, 'x', 'y', 'x']), [1, 'x'])
         self.assertEqual(get_duplicates(['a', 'b', 'c', 'b']), ['b'])
+        self.assertEqual(get_duplicates(['a', 'a', 'a', 'a']), ['a'])
 
     def test_robust_divide(self):
         self.assertEqual(robust_divide(0, 0), None)
         self.assertEqual(robust_divide(1, 0), None)
-        self.assertAlmostEqual(robust_divide(1, 1), 1)
-        self.assertAlmostEqual(robust_divide(1, 2), 0.5)
-        self.assertAlmostEqual(robust_divide(100, 2), 50)
+        self.assertEqual(robust_divide(1, 1), 1)
+        self.assertEqual(robust_divide(1, 2), 0.5)
+        self.assertEqual(robust_divide(100, 2), 50)
 
     def test_blunt(self):
         self.assertEqual(blunt(None, 1), None)
         self.assertEqual(blunt(None, 1, none_to_nan=True), 'nan')
 
-        self.assertEqual(blunt(0, 1), '0')
-        self.assertEqual(blunt(0., 1), '0')
-        self.assertEqual(blunt(-0., 1), '0')
-
         self.assertNotEqual(str(0.1 + 0.2), '0.3')
-        self.assertEqual(blunt(0.1 + 0.2, 1), '0.3')
-
-        self.assertEqual(blunt(89640, 1), '89640')
-        self.assertEqual(blunt(89640, 2), '89640')
-        self.assertEqual(blunt(89640, 3), '89640')
-        self.assertEqual(blunt(89640, 4), '89640')
-
-        self.assertEqual(blunt(69.42069, 1), '69.4')
-        self.assertEqual(blunt(69.42069, 2), '69.42')
-        self.assertEqual(blunt(69.42069, 3), '69.421')
-        self.assertEqual(blunt(69.42069, 4), '69.4207')
-        self.assertEqual(blunt(69.42069, 5), '69.42069')
-        self.assertEqual(blunt(69.42069, 6), '69.42069')
-
-        self.assertEqual(blunt(0.00123456789, 1), '0')
-        self.assertEqual(blunt(0.00123456789, 2), '0')
-        self.assertEqual(blunt(0.00123456789, 3), '0.001')
-        self.assertEqual(blunt(0.00123456789, 4), '0.0012')
-        self.assertEqual(blunt(0.00123456789, 5), '0.00123')
-        self.assertEqual(blunt(0.00123456789, 6), '0.001235')
-        self.assertEqual(blunt(0.00123456789, 7), '0.0012346')
-        self.assertEqual(blunt(0.00123456789, 8), '0.00123457')
-        self.assertEqual(blunt(0.00123456789, 9), '0.001234568')
-        self.assertEqual(blunt(0.00123456789, 10), '0.0012345679')
-        self.assertEqual(blunt(0.00123456789, 11), '0.00123456789')
-        self.assertEqual(blunt(0.00123456789, 12), '0.00123456789')
+
+        cases = (
+            (0, 1, '0'),
+            (0., 1, '0'),
+            (-0., 1, '0'),
+
+            (0.1 + 0.2, 1, '0.3'),
+
+            (89640, 0, '89640'),
+            (89640, 1, '89640'),
+            (89640, 2, '89640'),
+            (89640, 3, '89640'),
+            (89640, 4, '89640'),
+
+            (69.42069, 1, '69.4'),
+            (69.42069, 2, '69.42'),
+            (69.42069, 3, '69.421'),
+            (69.42069, 4, '69.4207'),
+            (69.42069, 5, '69.42069'),
+            (69.42069, 6, '69.42069'),
+
+            (0.00123456789, 1, '0'),
+            (0.00123456789, 2, '0'),
+            (0.00123456789, 3, '0.001'),
+            (0.00123456789, 4, '0.0012'),
+            (0.00123456789, 5, '0.00123'),
+            (0.00123456789, 6, '0.001235'),
+            (0.00123456789, 7, '0.0012346'),
+            (0.00123456789, 8, '0.00123457'),
+            (0.00123456789, 9, '0.001234568'),
+            (0.00123456789, 10, '0.0012345679'),
+            (0.00123456789, 11, '0.00123456789'),
+            (0.00123456789, 12, '0.00123456789'),
+        )
+        for number, max_decimal_places, expected_string in cases:
+            with self.subTest(number=number, max_decimal_places=max_decimal_places):
+                self.assertEqual(blunt(number, max_decimal_places), expected_string)
+
+    def test_score_master_match_line(self):
+        self.assertEqual(ScoreMaster.match_line('2023-08-20').lastgroup, 'date_line')
+        self.assertEqual(ScoreMaster.match_line('B=0.5  # comment').lastgroup, 'base_line')
+        self.assertEqual(ScoreMaster.match_line(' M=8').lastgroup, 'maximum_line')
+        self.assertEqual(ScoreMaster.match_line('R=half').lastgroup, 'responsibility_line')
+        self.assertEqual(ScoreMaster.match_line('S=spicy').lastgroup, 'spiciness_line')
+        self.assertEqual(ScoreMaster.match_line('A B C D').lastgroup, 'players_line')
+        self.assertEqual(ScoreMaster.match_line('d D S f').lastgroup, 'players_line')
+        self.assertEqual(ScoreMaster.match_line('- 7 d -').lastgroup, 'game_line')
+        self.assertEqual(ScoreMaster.match_line('  # comment').lastgroup, 'comment_line')
+        self.assertEqual(ScoreMaster.match_line('').lastgroup, 'comment_line')
+        self.assertIsNone(ScoreMaster.match_line('A B C'))
+        self.assertIsNone(ScoreMaster.match_line('2023-08-20 A'))
+
+    def test_score_master_parse_lines(self):
+        scores_text = 'A B C D \n 8 - - d \n # comment \n - 3 - - \n'
+        players_from_text, games_from_text = ScoreMaster.parse(scores_text)
+        players_from_lines, games_from_lines = ScoreMaster.parse(io.StringIO(scores_text))
+        self.assertEqual(len(games_from_lines), len(games_from_text))
+        self.assertEqual(
+            [(p.name, p.game_count, p.win_count, p.blame_count, p.net_score) for p in players_from_lines],
+            [(p.name, p.game_count, p.win_count, p.blame_count, p.net_score) for p in players_from_text],
+        )
+
+        for line_break in ['\f', '\x85', '\u2028']:
+            scores_text = f'A B C D \n 3 d - - \n{line_break}\n bad \n'
+            with self.subTest(line_break=line_break):
+                with self.assertRaises(ScoreMaster.InvalidLineException) as text_context:
+                    ScoreMaster.parse(scores_text)
+                with self.assertRaises(ScoreMaster.InvalidLineException) as lines_context:
+                    ScoreMaster.parse(io.StringIO(scores_text))
+                self.assertEqual(text_context.exception.line_number, 5)
+                self.assertEqual(lines_context.exception.line_number, 5)
+
+    def test_score_master_write_tsv_quoting(self):
+        score_master = ScoreMaster('"Ah B C D \n 3 d - -', start_date=None, end_date=None)
+        with tempfile.TemporaryDirectory() as directory_name:
+            tsv_file_name = os.path.join(directory_name, 'scores.tsv')
+            score_master.write_tsv(tsv_file_name)
+            with open(tsv_file_name, 'r', encoding='utf-8', newline='') as tsv_file:
+                tsv_text = tsv_file.read()
+        self.assertIn('"""Ah"\t', tsv_text)
+        rows = list(csv.reader(io.StringIO(tsv_text, newline=''), delimiter='\t'))
+        self.assertEqual(len(rows), 6)
+        self.assertIn('"Ah', [row[0] for row in rows])
 
     def test_score_master_bad_chronology(self):
-        self.assertRaises(
-            ScoreMaster.BadChronologyException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            '2023-08-20\n2023-08-19',
-        )
+        with self.assertRaises(ScoreMaster.BadChronologyException):
+            ScoreMaster.parse('2023-08-20\n2023-08-19')
 
     def test_score_master_bad_float(self):
-        self.assertRaises(
-            ScoreMaster.BadFloatException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'B=0..1',
-        )
+        with self.assertRaises(ScoreMaster.BadFloatException):
+            ScoreMaster.parse('B=0..1')
 
     def test_score_master_parse_duplicate_names(self):
-        self.assertRaises(
-            ScoreMaster.DuplicatePlayerNamesException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A A B C',
-        )
-        self.assertRaises(
-            ScoreMaster.DuplicatePlayerNamesException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A A A A',
-        )
+        with self.assertRaises(ScoreMaster.DuplicatePlayerNamesException):
+            ScoreMaster.parse('A A B C')
+        with self.assertRaises(ScoreMaster.DuplicatePlayerNamesException):
+            ScoreMaster.parse('A A A A')
         try:
             ScoreMaster.parse('A B C D')
         except ScoreMaster.DuplicatePlayerNamesException:
             self.fail('ScoreMaster.DuplicatePlayerNamesException raised erroneously')
 
     def test_score_master_no_players(self):
-        self.assertRaises(
-            ScoreMaster.NoPlayersException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            '0 1 2 3',
-        )
+        with self.assertRaises(ScoreMaster.NoPlayersException):
+            ScoreMaster.parse('0 1 2 3')
 
-    def test_score_master_extract_faan(self):
+    def test_score_master_normalise_results(self):
         self.assertEqual(
-            ScoreMaster.extract_faan((None, None, None, None), maximum_faan=13, line_number=None),
-            (None, None),
+            ScoreMaster.normalise_results(('-', '-', '-', '-')),
+            ((None, None, None, None), (None, None, None, None)),
         )
         self.assertEqual(
-            ScoreMaster.extract_faan((None, None, 13, None), maximum_faan=13, line_number=None),
-            (2, 13),
+            ScoreMaster.normalise_results(('-', '13', 'd', '-')),
+            ((None, 13, None, None), (None, None, 'd', None)),
         )
         self.assertEqual(
-            ScoreMaster.extract_faan((None, None, 13, None), maximum_faan=13, line_number=None),
-            (2, 13),
+            ScoreMaster.normalise_results(('0', 'S', '4', 'f')),
+            ((0, None, 4, None), (None, 'S', None, 'f')),
         )
 
+    def test_score_master_extract_faan(self):
+        cases = (
+            ((None, None, None, None), (None, None)),
+            ((None, None, 13, None), (2, 13)),
+            ((0, None, None, None), (0, 0)),
+        )
+        for faans, expected_winner in cases:
+            with self.subTest(faans=faans):
+                self.assertEqual(
+                    ScoreMaster.extract_faan(faans, maximum_faan=13, line_number=None),
+                    expected_winner,
+                )
+
     def test_score_master_multiple_winners(self):
-        self.assertRaises(
-            ScoreMaster.MultipleWinnersException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n 0 0 - -',
-        )
-        self.assertRaises(
-            ScoreMaster.MultipleWinnersException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n 0 - 8 -',
-        )
-        self.assertRaises(
-            ScoreMaster.MultipleWinnersException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n d 4 - 6',
-        )
+        with self.assertRaises(ScoreMaster.MultipleWinnersException):
+            ScoreMaster.parse('A B C D \n 0 0 - -')
+        with self.assertRaises(ScoreMaster.MultipleWinnersException):
+            ScoreMaster.parse('A B C D \n 0 - 8 -')
+        with self.assertRaises(ScoreMaster.MultipleWinnersException):
+            ScoreMaster.parse('A B C D \n d 4 - 6')
         try:
             ScoreMaster.parse('A B C D \n d - 7 -')
         except ScoreMaster.MultipleWinnersException:
             self.fail('ScoreMaster.MultipleWinnersException raised erroneously')
 
     def test_score_master_maximum_faan_exceeded(self):
-        self.assertRaises(
-            ScoreMaster.MaximumFaanExceededException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'M=4 \n A B C D \n 5 - - -',
-        )
+        with self.assertRaises(ScoreMaster.MaximumFaanExceededException):
+            ScoreMaster.parse('M=4 \n A B C D \n 5 - - -')
 
     def test_score_master_extract_blame(self):
-        self.assertEqual(
-            ScoreMaster.extract_blame((None, None, None, None), line_number=None),
-            (None, None),
-        )
-        self.assertEqual(
-            ScoreMaster.extract_blame((None, 'd', None, None), line_number=None),
-            (1, 'd'),
-        )
-        self.assertEqual(
-            ScoreMaster.extract_blame((None, 'D', None, None), line_number=None),
-            (1, 'D'),
-        )
-        self.assertEqual(
-            ScoreMaster.extract_blame((None, None, 'S', None), line_number=None),
-            (2, 'S'),
-        )
-        self.assertEqual(
-            ScoreMaster.extract_blame((None, None, None, 'f'), line_number=None),
-            (3, 'f'),
-        )
+        cases = (
+            ((None, None, None, None), (None, None)),
+            ((None, 'd', None, None), (1, 'd')),
+            ((None, 'D', None, None), (1, 'D')),
+            ((None, None, 'S', None), (2, 'S')),
+            ((None, None, None, 'f'), (3, 'f')),
+        )
+        for blames, expected_blame in cases:
+            with self.subTest(blames=blames):
+                self.assertEqual(
+                    ScoreMaster.extract_blame(blames, line_number=None),
+                    expected_blame,
+                )
 
     def test_score_master_multiple_blame(self):
-        self.assertRaises(
-            ScoreMaster.MultipleBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n 3 d d -',
-        )
-        self.assertRaises(
-            ScoreMaster.MultipleBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'R=half \n A B C D \n 4 - D S',
-        )
-        self.assertRaises(
-            ScoreMaster.MultipleBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n 5 f d S',
-        )
+        with self.assertRaises(ScoreMaster.MultipleBlameException):
+            ScoreMaster.parse('A B C D \n 3 d d -')
+        with self.assertRaises(ScoreMaster.MultipleBlameException):
+            ScoreMaster.parse('R=half \n A B C D \n 4 - D S')
+        with self.assertRaises(ScoreMaster.MultipleBlameException):
+            ScoreMaster.parse('A B C D \n 5 f d S')
         try:
             ScoreMaster.parse('A B C D \n 6 - d -')
         except ScoreMaster.MultipleBlameException:
@@ -192,21 +220,12 @@ class TestMahjongScore(unittest.TestCase):
             self.fail('ScoreMaster.MultipleBlameException raised erroneously')
 
     def test_score_master_no_win_yet_non_false_blame(self):
-        self.assertRaises(
-            ScoreMaster.NoWinYetNonFalseBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n d - - -',
-        )
-        self.assertRaises(
-            ScoreMaster.NoWinYetNonFalseBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'R=half \n A B C D \n - D - -',
-        )
-        self.assertRaises(
-            ScoreMaster.NoWinYetNonFalseBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n - - S -',
-        )
+        with self.assertRaises(ScoreMaster.NoWinYetNonFalseBlameException):
+            ScoreMaster.parse('A B C D \n d - - -')
+        with self.assertRaises(ScoreMaster.NoWinYetNonFalseBlameException):
+            ScoreMaster.parse('R=half \n A B C D \n - D - -')
+        with self.assertRaises(ScoreMaster.NoWinYetNonFalseBlameException):
+            ScoreMaster.parse('A B C D \n - - S -')
         try:
             ScoreMaster.parse('A B C D \n - - 3 -')
         except ScoreMaster.NoWinYetNonFalseBlameException:
@@ -221,16 +240,10 @@ class TestMahjongScore(unittest.TestCase):
             self.fail('ScoreMaster.NoWinYetNonFalseBlameException raised erroneously')
 
     def test_score_master_win_yet_false_blame(self):
-        self.assertRaises(
-            ScoreMaster.WinYetFalseBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n 1 f - -',
-        )
-        self.assertRaises(
-            ScoreMaster.WinYetFalseBlameException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'A B C D \n - - f 13',
-        )
+        with self.assertRaises(ScoreMaster.WinYetFalseBlameException):
+            ScoreMaster.parse('A B C D \n 1 f - -')
+        with self.assertRaises(ScoreMaster.WinYetFalseBlameException):
+            ScoreMaster.parse('A B C D \n - - f 13')
         try:
             ScoreMaster.parse('A B C D \n - f - -')
         except ScoreMaster.WinYetFalseBlameException:
@@ -241,11 +254,8 @@ class TestMahjongScore(unittest.TestCase):
             self.fail('ScoreMaster.WinYetFalseBlameException raised erroneously')
 
     def test_score_master_redundant_discard_guarantee(self):
-        self.assertRaises(
-            ScoreMaster.RedundantDiscardGuaranteeException,
-            lambda scores_text: ScoreMaster.parse(scores_text),
-            'R=full \n A B C D \n 1 D - -',
-        )
+        with self.assertRaises(ScoreMaster.RedundantDiscardGuaranteeException):
+            ScoreMaster.parse('R=full \n A B C D \n 1 D - -')
         try:
             ScoreMaster.parse('R=full \n A B C D \n 1 d - -')
         except ScoreMaster.RedundantDiscardGuaranteeException:
@@ -260,158 +270,128 @@ class TestMahjongScore(unittest.TestCase):
             self.fail('ScoreMaster.RedundantDiscardGuaranteeException raised erroneously')
 
     def test_game_compute_score_portion(self):
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=0), 1)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=1), 2)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=2), 4)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=3), 8)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=4), 16)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=5), 24)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=6), 32)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=7), 48)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=8), 64)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=9), 96)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=10), 128)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=11), 192)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=12), 256)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='half', faan=13), 384)
-
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=0), 1)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=1), 2)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=2), 4)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=3), 8)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=4), 16)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=5), 32)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=6), 64)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=7), 128)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=8), 256)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=9), 512)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=10), 1024)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=11), 2048)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=12), 4096)
-        self.assertEqual(Game.compute_score_portion(base=1, spiciness='spicy', faan=13), 8192)
+        portions_from_spiciness = {
+            'half': (1, 2, 4, 8, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384),
+            'spicy': (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192),
+        }
+        for spiciness, portions in portions_from_spiciness.items():
+            for faan, expected_portion in enumerate(portions):
+                with self.subTest(spiciness=spiciness, faan=faan):
+                    self.assertEqual(
+                        Game.compute_score_portion(base=1, spiciness=spiciness, faan=faan),
+                        expected_portion,
+                    )
 
         self.assertEqual(Game.compute_score_portion(base=10, spiciness='half', faan=5), 240)
         self.assertEqual(Game.compute_score_portion(base=3, spiciness='spicy', faan=10), 3072)
 
     def test_game_compute_net_scores(self):
-        # Draw (摸和)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=8, responsibility='full', spiciness='half',
-                winner_index=None, winner_faan=None, blame_index=None, blame_type=None,
+        # (base, maximum_faan, responsibility, spiciness,
+        #  winner_index, winner_faan, blame_index, blame_type,
+        #  net_scores)
+        cases = (
+            # Draw (摸和)
+            (
+                1, 8, 'full', 'half',
+                None, None, None, None,
+                (0, 0, 0, 0),
+            ),
+            (
+                0.5, 2100, 'full', 'half',
+                None, None, None, None,
+                (0, 0, 0, 0),
+            ),
+            (
+                1, 1100, 'full', 'spicy',
+                None, None, None, None,
+                (0, 0, 0, 0),
             ),
-            (0, 0, 0, 0),
-        )
 
-        # False-win (詐糊)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=8, responsibility='full', spiciness='half',
-                winner_index=None, winner_faan=None, blame_index=1, blame_type='f',
+            # False-win (詐糊)
+            (
+                1, 8, 'full', 'half',
+                None, None, 1, 'f',
+                (+192, -576, +192, +192),
             ),
-            (+192, -576, +192, +192),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=None, winner_faan=None, blame_index=1, blame_type='f',
+            (
+                1, 13, 'full', 'half',
+                None, None, 1, 'f',
+                (+1152, -3456, +1152, +1152),
             ),
-            (+1152, -3456, +1152, +1152),
-        )
 
-        # Self-drawn win (自摸)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=0, winner_faan=0, blame_index=None, blame_type=None,
+            # Self-drawn win (自摸)
+            (
+                1, 13, 'full', 'half',
+                0, 0, None, None,
+                (+3, -1, -1, -1),
             ),
-            (+3, -1, -1, -1),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=2, winner_faan=4, blame_index=None, blame_type=None,
+            (
+                1, 13, 'full', 'half',
+                2, 4, None, None,
+                (-16, -16, +48, -16),
             ),
-            (-16, -16, +48, -16),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=3, winner_faan=8, blame_index=None, blame_type=None,
+            (
+                1, 13, 'full', 'half',
+                3, 8, None, None,
+                (-64, -64, -64, +192),
             ),
-            (-64, -64, -64, +192),
-        )
 
-        # Discarding at half responsibility (打出半銃)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='half', spiciness='half',
-                winner_index=1, winner_faan=8, blame_index=2, blame_type='d',
+            # Discarding at half responsibility (打出半銃)
+            (
+                1, 13, 'half', 'half',
+                1, 8, 2, 'd',
+                (-32, +128, -64, -32),
             ),
-            (-32, +128, -64, -32),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='half', spiciness='spicy',
-                winner_index=1, winner_faan=8, blame_index=2, blame_type='d',
+            (
+                1, 13, 'half', 'spicy',
+                1, 8, 2, 'd',
+                (-128, +512, -256, -128),
             ),
-            (-128, +512, -256, -128),
-        )
 
-        # Discarding at full responsibility (打出全銃)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=0, winner_faan=8, blame_index=3, blame_type='d',
+            # Discarding at full responsibility (打出全銃)
+            (
+                1, 13, 'full', 'half',
+                0, 8, 3, 'd',
+                (+128, 0, 0, -128),
             ),
-            (+128, 0, 0, -128),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='spicy',
-                winner_index=0, winner_faan=8, blame_index=3, blame_type='d',
+            (
+                1, 13, 'full', 'spicy',
+                0, 8, 3, 'd',
+                (+512, 0, 0, -512),
             ),
-            (+512, 0, 0, -512),
-        )
 
-        # Discard guaranteeing (包打出)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='half', spiciness='half',
-                winner_index=0, winner_faan=8, blame_index=3, blame_type='D',
+            # Discard guaranteeing (包打出)
+            (
+                1, 13, 'half', 'half',
+                0, 8, 3, 'D',
+                (+128, 0, 0, -128),
             ),
-            (+128, 0, 0, -128),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='half', spiciness='spicy',
-                winner_index=0, winner_faan=8, blame_index=3, blame_type='D',
+            (
+                1, 13, 'half', 'spicy',
+                0, 8, 3, 'D',
+                (+512, 0, 0, -512),
             ),
-            (+512, 0, 0, -512),
-        )
 
-        # Self-draw guaranteeing (包自摸)
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=0, winner_faan=0, blame_index=1, blame_type='S',
+            # Self-draw guaranteeing (包自摸)
+            (
+                1, 13, 'full', 'half',
+                0, 0, 1, 'S',
+                (+3, -3, 0, 0),
             ),
-            (+3, -3, 0, 0),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=2, winner_faan=4, blame_index=0, blame_type='S',
+            (
+                1, 13, 'full', 'half',
+                2, 4, 0, 'S',
+                (-48, 0, +48, 0),
             ),
-            (-48, 0, +48, 0),
-        )
-        self.assertEqual(
-            Game.compute_net_scores(
-                base=1, maximum_faan=13, responsibility='full', spiciness='half',
-                winner_index=3, winner_faan=8, blame_index=2, blame_type='S',
+            (
+                1, 13, 'full', 'half',
+                3, 8, 2, 'S',
+                (0, 0, -192, +192),
             ),
-            (0, 0, -192, +192),
         )
+        for *arguments, expected_net_scores in cases:
+            with self.subTest(arguments=arguments):
+                self.assertEqual(Game.compute_net_scores(*arguments), expected_net_scores)
 
 
 if __name__ == '__main__':